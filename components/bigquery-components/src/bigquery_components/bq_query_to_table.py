@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from kfp.v2.dsl import component
+from typing import NamedTuple
 
 
 @component(
@@ -27,7 +28,8 @@ def bq_query_to_table(
     table_id: str = None,
     dataset_location: str = "EU",
     query_job_config: dict = None,
-) -> None:
+    table_expiration_hours: int = None,
+) -> NamedTuple("Outputs", [("row_count", int)]):
     """
     Run query & create a new BigQuery table
     Args:
@@ -41,11 +43,15 @@ def bq_query_to_table(
         required by the bq query operation. No need to specify destination param
         See available parameters here
         https://googleapis.dev/python/bigquery/latest/generated/google.cloud.bigquery.job.QueryJobConfig.html
+        table_expiration_hours (int): Optional. If set, the created table expires
+        (and is deleted by BigQuery) this many hours after the query completes.
+        Useful for staging tables which are recreated on every pipeline run.
     Returns:
-        None
+        NamedTuple: number of rows in the query results (0 if not available)
     """
     from google.cloud.exceptions import GoogleCloudError
     from google.cloud import bigquery
+    from datetime import datetime, timedelta, timezone
     import logging
 
     logging.getLogger().setLevel(logging.INFO)
@@ -71,3 +77,13 @@ def bq_query_to_table(
         logging.error(query_job.error_result)
         logging.error(query_job.errors)
         raise e
+
+    if (dest_table_ref is not None) and table_expiration_hours:
+        table = bq_client.get_table(dest_table_ref)
+        table.expires = datetime.now(timezone.utc) + timedelta(
+            hours=table_expiration_hours
+        )
+        bq_client.update_table(table, ["expires"])
+        logging.info(f"BQ table {dest_table_ref} expires at {table.expires}")
+
+    return (result.total_rows or 0,)
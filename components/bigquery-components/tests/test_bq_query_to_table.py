@@ -0,0 +1,88 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import bigquery_components
+
+bq_query_to_table = bigquery_components.bq_query_to_table.python_func
+
+
+@pytest.mark.parametrize(
+    "dataset_id,table_id,table_expiration_hours",
+    [
+        ("dataset", "table", 24),
+        ("dataset", "table", None),
+        (None, None, 24),
+    ],
+)
+def test_bq_query_to_table_expiration(dataset_id, table_id, table_expiration_hours):
+    """
+    Asserts bq_query_to_table only sets an expiry on the destination table when
+    both a destination table and table_expiration_hours are provided.
+    """
+    with patch("google.cloud.bigquery.client.Client") as mock_client:
+        bq_query_to_table(
+            query="SELECT 1",
+            bq_client_project_id="project",
+            destination_project_id="project",
+            dataset_id=dataset_id,
+            table_id=table_id,
+            table_expiration_hours=table_expiration_hours,
+        )
+
+    update_table = mock_client.return_value.update_table
+    if dataset_id and table_expiration_hours:
+        mock_client.return_value.get_table.assert_called_once_with(
+            "project.dataset.table"
+        )
+        update_table.assert_called_once()
+        table, fields = update_table.call_args[0]
+        assert fields == ["expires"]
+        expected_expiry = datetime.now(timezone.utc) + timedelta(
+            hours=table_expiration_hours
+        )
+        assert abs(table.expires - expected_expiry) < timedelta(minutes=1)
+    else:
+        update_table.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "dataset_id,table_id,total_rows,expected_row_count",
+    [
+        ("dataset", "table", 42, 42),
+        (None, None, None, 0),
+    ],
+)
+def test_bq_query_to_table_row_count(
+    dataset_id, table_id, total_rows, expected_row_count
+):
+    """
+    Asserts bq_query_to_table returns the number of rows in the query results,
+    falling back to 0 when BigQuery does not report it.
+    """
+    with patch("google.cloud.bigquery.client.Client") as mock_client:
+        query_result = mock_client.return_value.query.return_value.result
+        query_result.return_value.total_rows = total_rows
+
+        (row_count,) = bq_query_to_table(
+            query="SELECT 1",
+            bq_client_project_id="project",
+            destination_project_id="project",
+            dataset_id=dataset_id,
+            table_id=table_id,
+        )
+
+    assert row_count == expected_row_count
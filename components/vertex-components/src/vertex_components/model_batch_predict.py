@@ -35,6 +35,9 @@ def model_batch_predict(
     machine_type: str = "n1-standard-2",
     starting_replica_count: int = 1,
     max_replica_count: int = 1,
+    batch_size: int = None,
+    instance_count: int = None,
+    instances_per_replica: int = None,
     monitoring_training_dataset: dict = None,
     monitoring_alert_email_addresses: List[str] = None,
     monitoring_skew_config: dict = None,
@@ -57,6 +60,16 @@ def model_batch_predict(
         machine_type (str): Machine type.
         starting_replica_count (int): Starting replica count.
         max_replica_count (int): Max replicat count.
+        batch_size (int): Number of instances sent to a replica per request
+            (optional). Larger batches amortise per-request overhead, but
+            increase the memory used by each replica. See:
+            https://cloud.google.com/vertex-ai/docs/reference/rest/v1beta1/ManualBatchTuningParameters
+        instance_count (int): Number of input instances (optional). If provided
+            together with `instances_per_replica`, the job starts with enough
+            replicas for the input size (within `starting_replica_count` and
+            `max_replica_count`) instead of waiting for the autoscaler.
+        instances_per_replica (int): Target number of instances per replica used
+            with `instance_count` (optional).
         monitoring_skew_config (dict): Configuration of training-serving skew. See:
             https://cloud.google.com/python/docs/reference/aiplatform/latest/google.cloud.aiplatform_v1beta1.types.ModelMonitoringObjectiveConfig.TrainingPredictionSkewDetectionConfig
         monitoring_alert_email_addresses (List[str]):
@@ -71,6 +84,7 @@ def model_batch_predict(
     """
 
     import logging
+    import math
     import time
 
     from functools import partial
@@ -129,6 +143,16 @@ def model_batch_predict(
         input_config["gcsSource"] = {"uris": [source_uri]}
         output_config["gcsDestination"] = {"outputUriPrefix": destination_uri}
 
+    if instance_count and instances_per_replica:
+        required_replica_count = math.ceil(instance_count / instances_per_replica)
+        starting_replica_count = min(
+            max_replica_count, max(starting_replica_count, required_replica_count)
+        )
+        logging.info(
+            f"Starting with {starting_replica_count} replicas for "
+            f"{instance_count} instances"
+        )
+
     message = {
         "displayName": job_display_name,
         "model": model.metadata["resourceName"],
@@ -141,6 +165,9 @@ def model_batch_predict(
         },
     }
 
+    if batch_size:
+        message["manualBatchTuningParameters"] = {"batchSize": batch_size}
+
     if instance_config:
         message["instanceConfig"] = instance_config
 
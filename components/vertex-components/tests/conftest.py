@@ -14,6 +14,8 @@
 
 import pytest
 import kfp.v2.dsl
+from unittest.mock import Mock, patch
+from google.cloud.aiplatform_v1beta1.types.job_state import JobState
 
 
 @pytest.fixture(autouse=True)
@@ -48,3 +50,27 @@ def mock_kfp_artifact(monkeypatch):
 
     # mock the _get_path method of Artifact which is used by the property path
     monkeypatch.setattr(kfp.v2.dsl.Artifact, "_get_path", _get_path)
+
+
+@pytest.fixture
+def mock_job_service():
+    """
+    Mocks the Vertex AI job service used by batch prediction components, so that
+    created jobs immediately succeed.
+
+    Returns:
+        tuple: mocks of the create_batch_prediction_job and
+            get_batch_prediction_job methods, to assert on the submitted request.
+    """
+    mock_job = Mock()
+    mock_job.name = "mock-batch-job"
+    mock_job.state = JobState.JOB_STATE_SUCCEEDED
+
+    with patch(
+        "google.cloud.aiplatform_v1beta1.services.job_service.JobServiceClient.create_batch_prediction_job",  # noqa: E501
+        return_value=mock_job,
+    ) as create_job, patch(
+        "google.cloud.aiplatform_v1beta1.services.job_service.JobServiceClient.get_batch_prediction_job",  # noqa: E501
+        return_value=mock_job,
+    ) as get_job:
+        yield create_job, get_job
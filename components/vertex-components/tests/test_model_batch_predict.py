@@ -89,3 +89,69 @@ def test_model_batch_predict(
     assert (
         json.loads(gcp_resources)["resources"][0]["resourceUri"] == mock_resource_name
     )
+
+
+def test_model_batch_predict_batch_size(tmpdir, mock_job_service):
+    """
+    Asserts model_batch_predict sets the manual batch tuning parameters
+    when a batch size is provided.
+    """
+    create_job, _ = mock_job_service
+    mock_model = Model(uri=tmpdir, metadata={"resourceName": ""})
+
+    model_batch_predict(
+        model=mock_model,
+        job_display_name="",
+        project_location="",
+        project_id="",
+        source_uri="bq://a.b.c",
+        destination_uri="bq://a.b",
+        source_format="bigquery",
+        destination_format="bigquery",
+        batch_size=1024,
+    )
+
+    request = create_job.call_args[1]["batch_prediction_job"]
+    assert request.manual_batch_tuning_parameters.batch_size == 1024
+
+
+@pytest.mark.parametrize(
+    "instance_count,instances_per_replica,expected_replica_count",
+    [
+        (None, None, 2),
+        (10, 50, 2),
+        (200, 50, 4),
+        (1000, 50, 5),
+    ],
+)
+def test_model_batch_predict_replica_count(
+    tmpdir,
+    mock_job_service,
+    instance_count,
+    instances_per_replica,
+    expected_replica_count,
+):
+    """
+    Asserts model_batch_predict scales the starting replica count with the
+    number of instances, within the min and max replica counts.
+    """
+    create_job, _ = mock_job_service
+    mock_model = Model(uri=tmpdir, metadata={"resourceName": ""})
+
+    model_batch_predict(
+        model=mock_model,
+        job_display_name="",
+        project_location="",
+        project_id="",
+        source_uri="bq://a.b.c",
+        destination_uri="bq://a.b",
+        source_format="bigquery",
+        destination_format="bigquery",
+        starting_replica_count=2,
+        max_replica_count=5,
+        instance_count=instance_count,
+        instances_per_replica=instances_per_replica,
+    )
+
+    request = create_job.call_args[1]["batch_prediction_job"]
+    assert request.dedicated_resources.starting_replica_count == expected_replica_count
@@ -12,10 +12,27 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from functools import lru_cache
 from pathlib import Path
 from jinja2 import Template
 
 
+@lru_cache(maxsize=None)
+def _load_template(input_file: Path) -> Template:
+    """
+    Read and parse a Jinja template, caching the result so that templates
+    rendered several times (e.g. once per data split) are only parsed once.
+
+    Args:
+        input_file (Path): input file to read
+    Returns:
+        Template: parsed Jinja template
+    """
+
+    with open(input_file, "r") as f:
+        return Template(f.read())
+
+
 def generate_query(input_file: Path, **replacements) -> str:
     """
     Read input file and replace placeholder using Jinja.
@@ -27,7 +44,4 @@ def generate_query(input_file: Path, **replacements) -> str:
         str: replaced content of input file
     """
 
-    with open(input_file, "r") as f:
-        query_template = f.read()
-
-    return Template(query_template).render(**replacements)
+    return _load_template(Path(input_file)).render(**replacements)
@@ -36,6 +36,7 @@ def tensorflow_pipeline(
     batch_prediction_machine_type: str = "n1-standard-4",
     batch_prediction_min_replicas: int = 3,
     batch_prediction_max_replicas: int = 10,
+    batch_prediction_batch_size: int = 1024,
 ):
     """
     Tensorflow prediction pipeline which:
@@ -64,9 +65,12 @@ def tensorflow_pipeline(
         batch_prediction_machine_type (str): Machine type to be used for Vertex Batch
             Prediction. Example machine_types - n1-standard-4, n1-standard-16 etc
         batch_prediction_min_replicas (int): Minimum no of machines to distribute the
-            Vertex Batch Prediction job for horizontal scalability
+            Vertex Batch Prediction job for horizontal scalability. More machines are
+            used from the start if the ingested data is large.
         batch_prediction_max_replicas (int): Maximum no of machines to distribute the
             Vertex Batch Prediction job for horizontal scalability.
+        batch_prediction_batch_size (int): No of instances sent to each machine per
+            request during Vertex Batch Prediction.
 
     Returns:
         None
@@ -80,8 +84,16 @@ def tensorflow_pipeline(
     ingestion_table = "taxi_trips"
     table_suffix = "_tf_prediction"  # suffix to table names
     ingested_table = "ingested_data" + table_suffix
+    # the ingested table is recreated on every run, so let BigQuery clean it up
+    ingested_table_expiration_hours = 24
     monitoring_alert_email_addresses = []
     monitoring_skew_config = {"defaultSkewThreshold": {"value": 0.001}}
+    # all tasks only submit or poll jobs running in BigQuery and Vertex AI,
+    # so they can run on a small machine
+    light_task_cpu_limit = "1"
+    light_task_memory_limit = "2G"
+    # start the batch prediction job with roughly this many instances per machine
+    batch_prediction_instances_per_replica = 50000
 
     # generate sql queries which are used in ingestion and preprocessing
     # operations
@@ -95,6 +107,21 @@ def tensorflow_pipeline(
         filter_start_value=timestamp,
     )
 
+    # lookup champion model, this has no dependency on the ingested data so it
+    # runs in parallel with the ingestion
+    champion_model = (
+        lookup_model(
+            model_name=model_name,
+            project_location=project_location,
+            project_id=project_id,
+            fail_on_model_not_found=True,
+        )
+        .set_display_name("Look up champion model")
+        .set_caching_options(False)
+        .set_cpu_limit(light_task_cpu_limit)
+        .set_memory_limit(light_task_memory_limit)
+    )
+
     # data ingestion and preprocessing operations
     kwargs = dict(
         bq_client_project_id=project_id,
@@ -103,20 +130,20 @@ def tensorflow_pipeline(
         dataset_location=dataset_location,
         query_job_config=json.dumps(dict(write_disposition="WRITE_TRUNCATE")),
     )
-    ingest = bq_query_to_table(
-        query=ingest_query, table_id=ingested_table, **kwargs
-    ).set_display_name("Ingest data")
-
-    # lookup champion model
-    champion_model = (
-        lookup_model(
-            model_name=model_name,
-            project_location=project_location,
-            project_id=project_id,
-            fail_on_model_not_found=True,
+    # the ingested table is overwritten by every run, so never reuse a cached
+    # ingestion as the table may hold data from a different timestamp
+    ingest = (
+        bq_query_to_table(
+            query=ingest_query,
+            table_id=ingested_table,
+            table_expiration_hours=ingested_table_expiration_hours,
+            **kwargs,
         )
-        .set_display_name("Look up champion model")
+        .set_display_name("Ingest data")
         .set_caching_options(False)
+        .set_cpu_limit(light_task_cpu_limit)
+        .set_memory_limit(light_task_memory_limit)
+        .set_retry(num_retries=2, backoff_duration="60s")
     )
 
     # batch predict from BigQuery to BigQuery
@@ -138,13 +165,17 @@ def tensorflow_pipeline(
             machine_type=batch_prediction_machine_type,
             starting_replica_count=batch_prediction_min_replicas,
             max_replica_count=batch_prediction_max_replicas,
+            batch_size=batch_prediction_batch_size,
+            instance_count=ingest.outputs["row_count"],
+            instances_per_replica=batch_prediction_instances_per_replica,
             monitoring_training_dataset=champion_model.outputs["training_dataset"],
             monitoring_alert_email_addresses=monitoring_alert_email_addresses,
             monitoring_skew_config=monitoring_skew_config,
             instance_config=instance_config,
         )
-        .after(ingest)
         .set_display_name("Batch prediction job")
+        .set_cpu_limit(light_task_cpu_limit)
+        .set_memory_limit(light_task_memory_limit)
     )
 
 
@@ -0,0 +1,34 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pathlib import Path
+
+from pipelines import generate_query
+
+
+def test_generate_query(tmp_path):
+    """
+    Asserts a cached template renders the right replacements on every call, and that
+    the input file can be given as a str or a Path.
+    """
+    template = tmp_path / "query.sql"
+    template.write_text("SELECT * FROM `{{ source_table }}` WHERE lot IN {{ lots }}")
+
+    query_1 = generate_query(template, source_table="a", lots="(1)")
+    query_2 = generate_query(str(template), source_table="b", lots="(2)")
+    query_3 = generate_query(Path(str(template)), source_table="a", lots="(1)")
+
+    assert query_1 == "SELECT * FROM `a` WHERE lot IN (1)"
+    assert query_2 == "SELECT * FROM `b` WHERE lot IN (2)"
+    assert query_3 == query_1